@@ -86,8 +86,13 @@ class Grid:
     ):
         if length is None:
             length = self.width - x
-        for i in range(0, length):
-            self.set(x + i, y, obj_type())
+        if length <= 0:
+            return
+        assert 0 <= x and x + length <= self.width
+        assert 0 <= y < self.height
+        # Rows are contiguous in the flat cell list
+        start = y * self.width + x
+        self.grid[start : start + length] = [obj_type() for _ in range(length)]
 
     def vert_wall(
         self,
@@ -98,8 +103,14 @@ class Grid:
     ):
         if length is None:
             length = self.height - y
-        for j in range(0, length):
-            self.set(x, y + j, obj_type())
+        if length <= 0:
+            return
+        assert 0 <= x < self.width
+        assert 0 <= y and y + length <= self.height
+        # Columns are strided by the grid width in the flat cell list
+        start = y * self.width + x
+        stop = start + length * self.width
+        self.grid[start : stop : self.width] = [obj_type() for _ in range(length)]
 
     def wall_rect(self, x: int, y: int, w: int, h: int):
         self.horz_wall(x, y, w)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from operator import add
-
 from gymnasium.spaces import Discrete
 
 from minigrid.core.grid import Grid
@@ -69,6 +67,9 @@ class DynamicObstaclesEnv(MiniGridEnv):
 
     """
 
+    # Cell offset in front of the agent for each direction
+    _DIR_DELTAS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
     def __init__(
         self,
         size=8,
@@ -104,6 +105,10 @@ class DynamicObstaclesEnv(MiniGridEnv):
         self.action_space = Discrete(self.actions.forward + 1)
         self.reward_range = (-1, 1)
 
+        # Cache values read on every step
+        self._n_actions = int(self.action_space.n)
+        self._forward_action = int(self.actions.forward)
+
     @staticmethod
     def _gen_mission():
         return "get to the green goal square"
@@ -133,19 +138,28 @@ class DynamicObstaclesEnv(MiniGridEnv):
 
         self.mission = "get to the green goal square"
 
+    @property
+    def front_pos(self):
+        """
+        Get the position of the cell that is right in front of the agent
+        """
+
+        dx, dy = self._DIR_DELTAS[self.agent_dir]
+        return (int(self.agent_pos[0]) + dx, int(self.agent_pos[1]) + dy)
+
     def step(self, action):
         # Invalid action
-        if action >= self.action_space.n:
+        if action >= self._n_actions:
             action = 0
 
         # Check if there is an obstacle in front of the agent
         front_cell = self.grid.get(*self.front_pos)
-        not_clear = front_cell and front_cell.type != "goal"
+        not_clear = front_cell is not None and front_cell.type != "goal"
 
         # Update obstacle positions
         for i_obst in range(len(self.obstacles)):
             old_pos = self.obstacles[i_obst].cur_pos
-            top = tuple(map(add, old_pos, (-1, -1)))
+            top = (old_pos[0] - 1, old_pos[1] - 1)
 
             try:
                 self.place_obj(
@@ -159,9 +173,8 @@ class DynamicObstaclesEnv(MiniGridEnv):
         obs, reward, terminated, truncated, info = super().step(action)
 
         # If the agent tried to walk over an obstacle or wall
-        if action == self.actions.forward and not_clear:
+        if action == self._forward_action and not_clear:
             reward = -1
             terminated = True
-            return obs, reward, terminated, truncated, info
 
         return obs, reward, terminated, truncated, info
@@ -331,6 +331,9 @@ class MiniGridEnv(gym.Env):
         if size is None:
             size = (self.grid.width, self.grid.height)
 
+        # Compare positions as plain tuples rather than through numpy
+        agent_pos = None if self.agent_pos is None else tuple(self.agent_pos)
+
         num_tries = 0
 
         while True:
@@ -351,7 +354,7 @@ class MiniGridEnv(gym.Env):
                 continue
 
             # Don't place the object where the agent is
-            if np.array_equal(pos, self.agent_pos):
+            if pos == agent_pos:
                 continue
 
             # Check if there is a filtering criterion
@@ -11,6 +11,8 @@ from gymnasium.utils.env_checker import check_env, data_equivalence
 
 from minigrid.core.grid import Grid
 from minigrid.core.mission import MissionSpace
+from minigrid.core.world_object import Ball
+from minigrid.envs import DynamicObstaclesEnv
 from tests.utils import all_testing_env_specs, assert_equals
 
 CHECK_ENV_IGNORE_WARNINGS = [
@@ -327,3 +329,64 @@ def test_env_sync_vectorization(env_id):
     env.reset()
     env.step(env.action_space.sample())
     env.close()
+
+
+def test_dynamic_obstacles_front_pos():
+    env = gym.make("MiniGrid-Dynamic-Obstacles-8x8-v0").unwrapped
+    env.reset(seed=0)
+
+    for agent_dir, expected in enumerate([(2, 1), (1, 2), (0, 1), (1, 0)]):
+        env.agent_dir = agent_dir
+        front_pos = env.front_pos
+        assert isinstance(front_pos, tuple)
+        assert all(type(v) is int for v in front_pos)
+        assert front_pos == expected
+
+    env.close()
+
+
+def test_place_obj_avoids_agent():
+    env = gym.make("MiniGrid-Empty-5x5-v0").unwrapped
+    env.reset(seed=0)
+    env.agent_pos = np.array([2, 2])
+
+    # Only the agent's cell is free in this region, so placement must fail
+    with pytest.raises(RecursionError):
+        env.place_obj(None, top=(2, 2), size=(1, 1), max_tries=20)
+
+    env.close()
+
+
+def test_grid_walls():
+    grid = Grid(6, 5)
+    grid.horz_wall(1, 2, 3)
+    grid.vert_wall(4, 1, 3)
+
+    walls = {(i, j) for i in range(6) for j in range(5) if grid.get(i, j)}
+    assert walls == {(1, 2), (2, 2), (3, 2), (4, 1), (4, 2), (4, 3)}
+
+    # Every wall cell holds its own object
+    assert grid.get(1, 2) is not grid.get(2, 2)
+
+    with pytest.raises(AssertionError):
+        grid.vert_wall(0, 3, 3)
+
+
+def test_dynamic_obstacles_step():
+    env = DynamicObstaclesEnv(size=6, n_obstacles=0)
+    env.reset(seed=0)
+    assert env.agent_pos == (1, 1) and env.agent_dir == 0
+
+    # Out-of-range actions are treated as turning left
+    _, reward, terminated, _, _ = env.step(env.actions.done)
+    assert env.agent_dir == 3
+    assert reward == 0 and not terminated
+
+    # Walking into an obstacle ends the episode with a penalty
+    env.agent_dir = 0
+    env.put_obj(Ball(), 2, 1)
+    _, reward, terminated, _, _ = env.step(env.actions.forward)
+    assert env.agent_pos == (1, 1)
+    assert reward == -1 and terminated
+
+    env.close()